@@ -6,6 +6,9 @@ setup(
     packages=find_packages(where="src"),
     package_dir={"": "src"},
     python_requires=">=3.8",
+    extras_require={
+        "fast": ["pygit2"],
+    },
     entry_points={
         'console_scripts': [
             'pyresearch-init=pyresearch_init.init_research:main',  # CLI command
@@ -8,4 +8,4 @@ def hello_world():
     Returns:
         str: A greeting message
     """
-    return f"Hello from python-research-setup!"
+    return "Hello from python-research-setup!"
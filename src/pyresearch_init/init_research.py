@@ -9,22 +9,59 @@ and creates essential files including README.md, .gitignore, and more.
 
 import os
 import sys
-import argparse
 import subprocess
+import json
 import shutil
 from pathlib import Path
+from types import SimpleNamespace
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import textwrap
 from datetime import datetime
 
+_CURRENT_YEAR = datetime.now().year
+_IS_WINDOWS = os.name == 'nt'
+_PYEXE = sys.executable
+
+# Defaults shared by the argparse parser and the bare project-name fast path
+_DEFAULT_LOCATION = "."
+_DEFAULT_PYTHON_VERSION = ">=3.8"
+_DEFAULT_LICENSE = "MIT"
+_DEFAULT_DEPS = ("numpy", "pandas", "matplotlib", "pytest")
+
 
 def parse_arguments():
     """Parse command line arguments."""
+    # Fast path: a bare project name needs no argparse machinery
+    if len(sys.argv) == 2 and not sys.argv[1].startswith("-"):
+        return SimpleNamespace(
+            project_name=sys.argv[1],
+            location=_DEFAULT_LOCATION,
+            description="",
+            author="",
+            email="",
+            python_version=_DEFAULT_PYTHON_VERSION,
+            no_venv=False,
+            no_git=False,
+            license=_DEFAULT_LICENSE,
+            deps=list(_DEFAULT_DEPS),
+            open_vscode=False,
+        )
+    
+    return _build_parser().parse_args()
+
+
+@lru_cache(maxsize=1)
+def _build_parser():
+    """Build the command line parser once and reuse it across calls."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Set up a new Python research project with best practices."
     )
     parser.add_argument("project_name", help="Name of the project")
     parser.add_argument(
-        "--location", "-l", default=".", help="Parent directory for the project (default: current directory)"
+        "--location", "-l", default=_DEFAULT_LOCATION, help="Parent directory for the project (default: current directory)"
     )
     parser.add_argument(
         "--description", "-d", default="", help="Short description of the project"
@@ -36,7 +73,8 @@ def parse_arguments():
         "--email", "-e", default="", help="Author email"
     )
     parser.add_argument(
-        "--python-version", default=">=3.8", help="Python version requirement (default: >=3.8)"
+        "--python-version", default=_DEFAULT_PYTHON_VERSION,
+        help=f"Python version requirement (default: {_DEFAULT_PYTHON_VERSION})"
     )
     parser.add_argument(
         "--no-venv", action="store_true", help="Skip virtual environment creation"
@@ -45,50 +83,56 @@ def parse_arguments():
         "--no-git", action="store_true", help="Skip git initialization"
     )
     parser.add_argument(
-        "--license", default="MIT", choices=["MIT", "Apache-2.0", "GPL-3.0", "BSD-3-Clause", "None"], 
-        help="License to use (default: MIT)"
+        "--license", default=_DEFAULT_LICENSE, choices=["MIT", "Apache-2.0", "GPL-3.0", "BSD-3-Clause", "None"], 
+        help=f"License to use (default: {_DEFAULT_LICENSE})"
     )
     parser.add_argument(
-        "--deps", nargs="+", default=["numpy", "pandas", "matplotlib", "pytest"],
-        help="Initial Python dependencies (default: numpy pandas matplotlib pytest)"
+        "--deps", nargs="+", default=list(_DEFAULT_DEPS),
+        help=f"Initial Python dependencies (default: {' '.join(_DEFAULT_DEPS)})"
     )
     parser.add_argument(
         "--open-vscode", action="store_true", 
         help="Open the project in VSCode after creation"
     )
     
-    return parser.parse_args()
+    return parser
 
 
-def create_directory_structure(project_path):
+def create_directory_structure(project_path, project_name):
     """Create the project directory structure."""
-    directories = [
-        "src",
-        f"src/{args.project_name}",
-        "notebooks",
-        "tests",
-        "data/raw",
-        "data/processed",
-        "results/figures",
-        "results/models",
-        "docs"
-    ]
+    directories = (
+        f"{project_path}/src/{project_name}",
+        f"{project_path}/notebooks",
+        f"{project_path}/tests",
+        f"{project_path}/data/raw",
+        f"{project_path}/data/processed",
+        f"{project_path}/results/figures",
+        f"{project_path}/results/models",
+        f"{project_path}/docs",
+    )
     
     for directory in directories:
-        os.makedirs(os.path.join(project_path, directory), exist_ok=True)
+        os.makedirs(directory, exist_ok=True)
         
-    # Create __init__.py files
-    Path(project_path / "src" / args.project_name / "__init__.py").touch()
-    Path(project_path / "tests" / "__init__.py").touch()
+    # Create empty __init__.py files
+    for init_file in (f"{project_path}/src/{project_name}/__init__.py", f"{project_path}/tests/__init__.py"):
+        os.close(os.open(init_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644))
     
     print(f"✅ Created directory structure")
 
 
-def create_readme(project_path, args):
-    """Create README.md with project information."""
-    readme_content = f"""# {args.project_name}
+def _template_values(args):
+    """Return the substitution values shared by the project file templates."""
+    values = dict(vars(args))
+    values["author_name"] = args.author if args.author else "Your Name"
+    values["author_email"] = args.email if args.email else "your.email@example.com"
+    values["dependencies"] = ", ".join(f'"{dep}"' for dep in args.deps)
+    return values
+
 
-{args.description}
+_README_TEMPLATE = """# {project_name}
+
+{description}
 
 ## Overview
 
@@ -99,7 +143,7 @@ def create_readme(project_path, args):
 ```bash
 # Clone the repository
 git clone <repository-url>
-cd {args.project_name}
+cd {project_name}
 
 # Create and activate virtual environment
 python -m venv venv
@@ -112,7 +156,7 @@ pip install -r requirements.txt
 ## Project Structure
 
 ```
-{args.project_name}/
+{project_name}/
 ├── README.md              # Project overview, setup instructions
 ├── LICENSE                # License information
 ├── .gitignore             # Files to exclude from version control
@@ -120,7 +164,7 @@ pip install -r requirements.txt
 ├── requirements.txt       # Package dependencies
 ├── setup.py               # Package installation
 ├── src/                   # Source code
-│   └── {args.project_name}/  # Main package
+│   └── {project_name}/  # Main package
 ├── notebooks/             # Research notebooks
 ├── tests/                 # Unit and integration tests
 ├── data/                  # Data files
@@ -138,28 +182,21 @@ pip install -r requirements.txt
 
 ## Contact
 
-{args.author if args.author else 'Your Name'} - {args.email if args.email else 'your.email@example.com'}
+{author_name} - {author_email}
 
 """
-    
-    with open(project_path / "README.md", "w") as f:
-        f.write(readme_content)
-    
-    print(f"✅ Created README.md")
 
 
-def create_license(project_path, license_type, author):
-    """Create license file based on the chosen license type."""
-    if license_type == "None":
-        return
+def create_readme(project_path, values):
+    """Return README.md with project information as (path, content) pairs."""
+    readme_content = _README_TEMPLATE.format_map(values)
     
-    current_year = datetime.now().year
-    author_name = author if author else "Your Name"
-    
-    if license_type == "MIT":
-        license_content = f"""MIT License
+    return [(project_path / "README.md", readme_content)]
+
+
+_MIT_BYTES = b"""MIT License
 
-Copyright (c) {current_year} {author_name}
+Copyright (c) __YEAR__ __AUTHOR__
 
 Permission is hereby granted, free of charge, to any person obtaining a copy
 of this software and associated documentation files (the "Software"), to deal
@@ -179,8 +216,9 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
-    elif license_type == "Apache-2.0":
-        license_content = f"""Copyright {current_year} {author_name}
+
+
+_APACHE_BYTES = b"""Copyright __YEAR__ __AUTHOR__
 
 Licensed under the Apache License, Version 2.0 (the "License");
 you may not use this file except in compliance with the License.
@@ -194,8 +232,9 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
-    elif license_type == "GPL-3.0":
-        license_content = f"""Copyright (C) {current_year} {author_name}
+
+
+_GPL_BYTES = b"""Copyright (C) __YEAR__ __AUTHOR__
 
 This program is free software: you can redistribute it and/or modify
 it under the terms of the GNU General Public License as published by
@@ -210,8 +249,9 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-    else:  # BSD-3-Clause
-        license_content = f"""Copyright {current_year} {author_name}
+
+
+_BSD_BYTES = b"""Copyright __YEAR__ __AUTHOR__
 
 Redistribution and use in source and binary forms, with or without modification,
 are permitted provided that the following conditions are met:
@@ -239,15 +279,34 @@ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
-    with open(project_path / "LICENSE", "w") as f:
-        f.write(license_content)
+
+# License bodies with __YEAR__ and __AUTHOR__ placeholders
+_LICENSE_BYTES = {
+    "MIT": _MIT_BYTES,
+    "Apache-2.0": _APACHE_BYTES,
+    "GPL-3.0": _GPL_BYTES,
+    "BSD-3-Clause": _BSD_BYTES,
+}
+
+
+def create_license(project_path, license_type, author):
+    """Return the license file for the chosen license type as (path, content) pairs."""
+    author_name = author if author else "Your Name"
     
-    print(f"✅ Created {license_type} LICENSE file")
+    license_content = (
+        _LICENSE_BYTES[license_type]
+        .replace(b"__YEAR__", str(_CURRENT_YEAR).encode())
+        .replace(b"__AUTHOR__", author_name.encode("utf-8"))
+    )
+    
+    return [(project_path / "LICENSE", license_content)]
 
 
-def create_gitignore(project_path):
-    """Create .gitignore file with common Python ignores."""
-    gitignore_content = """# Byte-compiled / optimized / DLL files
+# Data and result directories kept in git through an empty .gitkeep marker
+_GITKEEP_DIRS = ("data/raw", "data/processed", "results/figures", "results/models")
+
+
+_GITIGNORE_BYTES = b"""# Byte-compiled / optimized / DLL files
 __pycache__/
 *.py[cod]
 *$py.class
@@ -317,34 +376,33 @@ results/models/*
 .DS_Store
 Thumbs.db
 """
-    
-    with open(project_path / ".gitignore", "w") as f:
-        f.write(gitignore_content)
+
+
+def create_gitignore(project_path):
+    """Return .gitignore with common Python ignores and .gitkeep markers as (path, content) pairs."""
+    files = [(project_path / ".gitignore", _GITIGNORE_BYTES)]
     
     # Create .gitkeep files to preserve empty directories
-    for dir_path in ["data/raw", "data/processed", "results/figures", "results/models"]:
-        with open(project_path / dir_path / ".gitkeep", "w") as f:
-            pass
+    for dir_path in _GITKEEP_DIRS:
+        files.append((project_path / dir_path / ".gitkeep", b""))
     
-    print(f"✅ Created .gitignore and .gitkeep files")
+    return files
 
 
-def create_pyproject_toml(project_path, args):
-    """Create pyproject.toml for modern Python packaging."""
-    pyproject_content = f"""[build-system]
+_PYPROJECT_TEMPLATE = """[build-system]
 requires = ["setuptools>=42", "wheel"]
 build-backend = "setuptools.build_meta"
 
 [project]
-name = "{args.project_name}"
+name = "{project_name}"
 version = "0.1.0"
-description = "{args.description}"
+description = "{description}"
 readme = "README.md"
 authors = [
-    {{name = "{args.author if args.author else 'Your Name'}", email = "{args.email if args.email else 'your.email@example.com'}"}}
+    {{name = "{author_name}", email = "{author_email}"}}
 ]
-requires-python = "{args.python_version}"
-license = {{"text" = "{args.license}"}}
+requires-python = "{python_version}"
+license = {{"text" = "{license}"}}
 classifiers = [
     "Development Status :: 3 - Alpha",
     "Intended Audience :: Science/Research",
@@ -354,7 +412,7 @@ classifiers = [
     "Programming Language :: Python :: 3.10",
 ]
 dependencies = [
-    {', '.join(f'"{dep}"' for dep in args.deps)}
+    {dependencies}
 ]
 
 [project.optional-dependencies]
@@ -389,44 +447,40 @@ disallow_incomplete_defs = true
 testpaths = ["tests"]
 python_files = "test_*.py"
 """
+
+
+def create_pyproject_toml(project_path, values):
+    """Return pyproject.toml for modern Python packaging as (path, content) pairs."""
+    pyproject_content = _PYPROJECT_TEMPLATE.format_map(values)
     
-    with open(project_path / "pyproject.toml", "w") as f:
-        f.write(pyproject_content)
-    
-    print(f"✅ Created pyproject.toml")
+    return [(project_path / "pyproject.toml", pyproject_content)]
 
 
-def create_setup_py(project_path, args):
-    """Create setup.py for backward compatibility."""
-    setup_content = f"""from setuptools import setup, find_packages
+_SETUP_PY_TEMPLATE = """from setuptools import setup, find_packages
 
 setup(
-    name="{args.project_name}",
+    name="{project_name}",
     version="0.1.0",
     packages=find_packages(where="src"),
     package_dir={{"": "src"}},
-    python_requires="{args.python_version}",
+    python_requires="{python_version}",
 )
 """
+
+
+def create_setup_py(project_path, values):
+    """Return setup.py for backward compatibility as (path, content) pairs."""
+    setup_content = _SETUP_PY_TEMPLATE.format_map(values)
     
-    with open(project_path / "setup.py", "w") as f:
-        f.write(setup_content)
-    
-    print(f"✅ Created setup.py")
+    return [(project_path / "setup.py", setup_content)]
 
 
 def create_requirements_txt(project_path, deps):
-    """Create requirements.txt with specified dependencies."""
-    with open(project_path / "requirements.txt", "w") as f:
-        f.write("\n".join(deps))
-    
-    print(f"✅ Created requirements.txt with dependencies: {', '.join(deps)}")
+    """Return requirements.txt with specified dependencies as (path, content) pairs."""
+    return [(project_path / "requirements.txt", "\n".join(deps))]
 
 
-def create_sample_code(project_path, project_name):
-    """Create sample code files."""
-    # Create core.py
-    core_content = f"""\"\"\"
+_CORE_TEMPLATE = """\"\"\"
 Core functionality for the {project_name} project.
 \"\"\"
 
@@ -436,14 +490,11 @@ def hello_world():
     Returns:
         str: A greeting message
     \"\"\"
-    return f"Hello from {project_name}!"
+    return "Hello from {project_name}!"
 """
-    
-    with open(project_path / "src" / project_name / "core.py", "w") as f:
-        f.write(core_content)
-    
-    # Create utils.py
-    utils_content = f"""\"\"\"
+
+
+_UTILS_TEMPLATE = """\"\"\"
 Utility functions for the {project_name} project.
 \"\"\"
 
@@ -458,12 +509,9 @@ def sample_utility_function(value):
     \"\"\"
     return value
 """
-    
-    with open(project_path / "src" / project_name / "utils.py", "w") as f:
-        f.write(utils_content)
-    
-    # Create a sample test
-    test_content = f"""\"\"\"
+
+
+_TEST_TEMPLATE = """\"\"\"
 Test cases for {project_name} core functionality.
 \"\"\"
 import pytest
@@ -473,158 +521,206 @@ from {project_name}.core import hello_world
 def test_hello_world():
     \"\"\"Test that hello_world returns the expected greeting.\"\"\"
     result = hello_world()
-    assert f"Hello from {project_name}!" in result
+    assert "Hello from {project_name}!" in result
 """
+
+
+# Cell sources may contain a "{project_name}" placeholder, filled in per project
+_NB_TEMPLATE = {
+    "cells": [
+        {
+            "cell_type": "markdown",
+            "metadata": {},
+            "source": [
+                "# {project_name} Research Notebook\n",
+                "\n",
+                "This is a sample Jupyter notebook for your research project.\n",
+                "\n",
+                "## Setup",
+            ],
+        },
+        {
+            "cell_type": "code",
+            "execution_count": None,
+            "metadata": {},
+            "source": [
+                "import sys\n",
+                "import os\n",
+                "\n",
+                "# Add the src directory to the path so we can import our package\n",
+                "sys.path.append('../')\n",
+                "\n",
+                "import numpy as np\n",
+                "import pandas as pd\n",
+                "import matplotlib.pyplot as plt\n",
+                "\n",
+                "# Import your package\n",
+                "from src.{project_name} import core\n",
+                "\n",
+                "%matplotlib inline",
+            ],
+        },
+        {
+            "cell_type": "markdown",
+            "metadata": {},
+            "source": [
+                "## Test Your Package",
+            ],
+        },
+        {
+            "cell_type": "code",
+            "execution_count": None,
+            "metadata": {},
+            "source": [
+                "# Test your package\n",
+                "print(core.hello_world())",
+            ],
+        },
+        {
+            "cell_type": "markdown",
+            "metadata": {},
+            "source": [
+                "## Research Notes\n",
+                "\n",
+                "Add your research notes, experiments, and findings here.",
+            ],
+        },
+    ],
+    "metadata": {
+        "kernelspec": {
+            "display_name": "Python 3",
+            "language": "python",
+            "name": "python3",
+        },
+        "language_info": {
+            "codemirror_mode": {
+                "name": "ipython",
+                "version": 3,
+            },
+            "file_extension": ".py",
+            "mimetype": "text/x-python",
+            "name": "python",
+            "nbconvert_exporter": "python",
+            "pygments_lexer": "ipython3",
+            "version": "3.8.0",
+        },
+    },
+    "nbformat": 4,
+    "nbformat_minor": 4,
+}
+
+
+def create_sample_code(project_path, project_name):
+    """Return sample code files as (path, content) pairs."""
+    # Create core.py
+    core_content = _CORE_TEMPLATE.format(project_name=project_name)
+    
+    files = [(project_path / "src" / project_name / "core.py", core_content)]
     
-    with open(project_path / "tests" / f"test_core.py", "w") as f:
-        f.write(test_content)
+    # Create utils.py
+    utils_content = _UTILS_TEMPLATE.format(project_name=project_name)
+    
+    files.append((project_path / "src" / project_name / "utils.py", utils_content))
+    
+    # Create a sample test
+    test_content = _TEST_TEMPLATE.format(project_name=project_name)
+    
+    files.append((project_path / "tests" / f"test_core.py", test_content))
     
     # Create a sample Jupyter notebook
-    notebook_content = """{
- "cells": [
-  {
-   "cell_type": "markdown",
-   "metadata": {},
-   "source": [
-    "# {project_name} Research Notebook\\n",
-    "\\n",
-    "This is a sample Jupyter notebook for your research project.\\n",
-    "\\n",
-    "## Setup"
-   ]
-  },
-  {
-   "cell_type": "code",
-   "execution_count": null,
-   "metadata": {},
-   "source": [
-    "import sys\\n",
-    "import os\\n",
-    "\\n",
-    "# Add the src directory to the path so we can import our package\\n",
-    "sys.path.append('../')\\n",
-    "\\n",
-    "import numpy as np\\n",
-    "import pandas as pd\\n",
-    "import matplotlib.pyplot as plt\\n",
-    "\\n",
-    "# Import your package\\n",
-    "from src.{project_name} import core\\n",
-    "\\n",
-    "%matplotlib inline"
-   ]
-  },
-  {
-   "cell_type": "markdown",
-   "metadata": {},
-   "source": [
-    "## Test Your Package"
-   ]
-  },
-  {
-   "cell_type": "code",
-   "execution_count": null,
-   "metadata": {},
-   "source": [
-    "# Test your package\\n",
-    "print(core.hello_world())"
-   ]
-  },
-  {
-   "cell_type": "markdown",
-   "metadata": {},
-   "source": [
-    "## Research Notes\\n",
-    "\\n",
-    "Add your research notes, experiments, and findings here."
-   ]
-  }
- ],
- "metadata": {
-  "kernelspec": {
-   "display_name": "Python 3",
-   "language": "python",
-   "name": "python3"
-  },
-  "language_info": {
-   "codemirror_mode": {
-    "name": "ipython",
-    "version": 3
-   },
-   "file_extension": ".py",
-   "mimetype": "text/x-python",
-   "name": "python",
-   "nbconvert_exporter": "python",
-   "pygments_lexer": "ipython3",
-   "version": "3.8.0"
-  }
- },
- "nbformat": 4,
- "nbformat_minor": 4
-}
-""".replace("{project_name}", project_name)
+    notebook = dict(_NB_TEMPLATE)
+    notebook["cells"] = [
+        dict(cell, source=[line.replace("{project_name}", project_name) for line in cell["source"]])
+        for cell in _NB_TEMPLATE["cells"]
+    ]
+    notebook_content = json.dumps(notebook, indent=1, ensure_ascii=False) + "\n"
     
-    with open(project_path / "notebooks" / "sample_notebook.ipynb", "w") as f:
-        f.write(notebook_content)
+    files.append((project_path / "notebooks" / "sample_notebook.ipynb", notebook_content))
     
-    print(f"✅ Created sample code and notebook files")
+    return files
 
 
 def initialize_git(project_path):
-    """Initialize git repository."""
+    """Initialize git repository, in-process via pygit2 when it is installed.
+    
+    Returns:
+        tuple: (success, error message or None)
+    """
     try:
-        subprocess.run(["git", "init"], cwd=project_path, check=True)
-        # Create .gitkeep files to track empty directories
-        print(f"✅ Initialized git repository")
-        return True
+        import pygit2  # Optional: pip install python-research-setup[fast]
+    except ImportError:
+        pygit2 = None
+    
+    if pygit2 is not None:
+        try:
+            pygit2.init_repository(str(project_path))
+            return True, None
+        except pygit2.GitError:
+            pass  # Fall back to the git command line
+    
+    try:
+        subprocess.run(["git", "init"], cwd=project_path, check=True, capture_output=True, text=True)
+        return True, None
+    except subprocess.CalledProcessError as e:
+        return False, e.stderr.strip() or str(e)
     except (subprocess.SubprocessError, FileNotFoundError):
-        print(f"❌ Failed to initialize git repository. Is git installed?")
-        return False
+        return False, "git could not be run. Is git installed?"
 
 
-def create_virtual_environment(project_path, project_name):
-    """Create and initialize virtual environment."""
+def create_virtual_environment(project_path, project_name, deps):
+    """Create the virtual environment.
+    
+    Returns:
+        tuple: (activation command or None, error message or None)
+    """
+    # Skip bootstrapping pip only when there is nothing to install with it
+    venv_cmd = [_PYEXE, "-m", "venv", "venv"] if deps else [_PYEXE, "-m", "venv", "--without-pip", "venv"]
     try:
-        subprocess.run([sys.executable, "-m", "venv", "venv"], cwd=project_path, check=True)
-        print(f"✅ Created virtual environment")
+        subprocess.run(
+            venv_cmd,
+            cwd=project_path,
+            check=True,
+            capture_output=True,
+            text=True
+        )
         
         # Create activation instructions
-        if os.name == 'nt':  # Windows
+        if _IS_WINDOWS:
             activate_script = os.path.join(project_path, "venv", "Scripts", "activate.bat")
             activate_cmd = f"venv\\Scripts\\activate"
         else:  # Unix/Linux/Mac
             activate_script = os.path.join(project_path, "venv", "bin", "activate")
             activate_cmd = f"source venv/bin/activate"
         
-        # Try to install packages
-        try:
-            if os.name == 'nt':  # Windows
-                subprocess.run(
-                    f"venv\\Scripts\\pip install -r requirements.txt", 
-                    cwd=project_path, 
-                    shell=True, 
-                    check=True
-                )
-            else:
-                subprocess.run(
-                    f"venv/bin/pip install -r requirements.txt", 
-                    cwd=project_path, 
-                    shell=True, 
-                    check=True
-                )
-            print(f"✅ Installed dependencies in virtual environment")
-        except subprocess.SubprocessError:
-            print(f"⚠️ Failed to install dependencies. You can install them manually.")
-        
-        return activate_cmd
-    except subprocess.SubprocessError:
-        print(f"❌ Failed to create virtual environment")
-        return None
+        return activate_cmd, None
+    except subprocess.CalledProcessError as e:
+        return None, e.stderr.strip() or str(e)
+    except subprocess.SubprocessError as e:
+        return None, str(e)
 
 
-def create_readme_docs(project_path, project_name):
-    """Create a simple README in the docs directory."""
-    docs_readme = f"""# {project_name} Documentation
+def install_dependencies(project_path, deps):
+    """Install requirements.txt into the project's virtual environment."""
+    if not deps:
+        return
+    
+    if _IS_WINDOWS:
+        venv_python = os.path.join(project_path, "venv", "Scripts", "python.exe")
+    else:
+        venv_python = os.path.join(project_path, "venv", "bin", "python")
+    
+    try:
+        subprocess.run(
+            [venv_python, "-m", "pip", "install", "--disable-pip-version-check", "--no-input", "-r", "requirements.txt"],
+            cwd=project_path,
+            check=True
+        )
+        print(f"✅ Installed dependencies in virtual environment")
+    except (subprocess.SubprocessError, FileNotFoundError):
+        print(f"⚠️ Failed to install dependencies. You can install them manually.")
+
+
+_DOCS_README_TEMPLATE = """# {project_name} Documentation
 
 This directory contains documentation for the {project_name} project.
 
@@ -648,14 +744,115 @@ make html
 
 Then open `_build/html/index.html` in your browser.
 """
+
+
+def create_readme_docs(project_path, project_name):
+    """Return a simple README for the docs directory as (path, content) pairs."""
+    docs_readme = _DOCS_README_TEMPLATE.format(project_name=project_name)
     
-    with open(project_path / "docs" / "README.md", "w") as f:
-        f.write(docs_readme)
+    return [(project_path / "docs" / "README.md", docs_readme)]
+
+
+def write_files(files):
+    """Write a list of (path, bytes) pairs to disk with unbuffered raw writes."""
+    for path, data in files:
+        os.makedirs(path.parent, exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            # Empty markers such as .gitkeep need only the open/close pair
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+
+def remove_directory(path):
+    """Recursively delete a directory, using rm -rf where available."""
+    if _IS_WINDOWS:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    
+    try:
+        subprocess.run(["rm", "-rf", str(path)], check=True)
+    except (subprocess.SubprocessError, FileNotFoundError):
+        shutil.rmtree(path)
+
+
+def create_vscode_settings(project_path):
+    """Write .vscode settings and extension recommendations for the project."""
+    # Create VSCode settings to use the virtual environment
+    vscode_dir = project_path / ".vscode"
+    os.makedirs(vscode_dir, exist_ok=True)
+    
+    # Create settings.json with Python path to the virtual environment
+    settings = {
+        "python.defaultInterpreterPath": "${workspaceFolder}/venv/bin/python",
+        "python.terminal.activateEnvironment": True,
+        "git.enableSmartCommit": True,
+        "editor.formatOnSave": True,
+        "python.formatting.provider": "black",
+        "python.linting.enabled": True,
+        "python.linting.flake8Enabled": True
+    }
+    
+    # Windows uses a different path
+    if _IS_WINDOWS:
+        settings["python.defaultInterpreterPath"] = "${workspaceFolder}\\venv\\Scripts\\python.exe"
+    
+    # Write settings.json
+    (vscode_dir / "settings.json").write_bytes(json.dumps(settings, indent=4).encode("utf-8"))
+    
+    # Create VSCode extensions recommendations
+    extensions = {
+        "recommendations": [
+            "ms-python.python",
+            "ms-python.vscode-pylance",
+            "ms-toolsai.jupyter",
+            "njpwerner.autodocstring",
+            "streetsidesoftware.code-spell-checker"
+        ]
+    }
+    
+    (vscode_dir / "extensions.json").write_bytes(json.dumps(extensions, indent=4).encode("utf-8"))
+
+
+def write_project_files(project_path, args):
+    """Generate every project file and write them to disk in one pass."""
+    values = _template_values(args)
+    steps = [
+        (True, create_readme, (project_path, values), "Created README.md"),
+        (True, create_gitignore, (project_path,), "Created .gitignore and .gitkeep files"),
+        (True, create_pyproject_toml, (project_path, values), "Created pyproject.toml"),
+        (True, create_setup_py, (project_path, values), "Created setup.py"),
+        (True, create_requirements_txt, (project_path, args.deps),
+         f"Created requirements.txt with dependencies: {', '.join(args.deps)}"),
+        (True, create_sample_code, (project_path, args.project_name), "Created sample code and notebook files"),
+        (True, create_readme_docs, (project_path, args.project_name), None),
+        (args.license != "None", create_license, (project_path, args.license, args.author),
+         f"Created {args.license} LICENSE file"),
+    ]
+    
+    # Collect file contents, then write them all in one pass
+    contents = []
+    for enabled, step, step_args, _ in steps:
+        if enabled:
+            contents += step(*step_args)
+    
+    files = [
+        (path, content if isinstance(content, bytes) else content.encode("utf-8"))
+        for path, content in contents
+    ]
+    write_files(files)
+    
+    # Report only once the files are actually on disk
+    for enabled, _, _, message in steps:
+        if enabled and message:
+            print(f"✅ {message}")
 
 
 def main():
     """Main function to set up the project."""
-    global args
     args = parse_arguments()
     
     # Normalize project path
@@ -669,7 +866,12 @@ def main():
         if overwrite not in ["yes", "y"]:
             print("Aborting setup.")
             sys.exit(1)
-        shutil.rmtree(project_path)
+        remove_directory(project_path)
+        if project_path.exists():
+            # rmtree(ignore_errors=True) leaves locked files behind, typically in an old venv on Windows
+            print(f"❌ Could not fully remove {project_path}.")
+            print("   Close any programs using files in it and try again.")
+            sys.exit(1)
     
     # Create project directory
     os.makedirs(project_path, exist_ok=True)
@@ -677,29 +879,44 @@ def main():
     print(f"Location: {project_path}")
     
     # Create directory structure
-    create_directory_structure(project_path)
-    
-    # Create files
-    create_readme(project_path, args)
-    create_gitignore(project_path)
-    create_pyproject_toml(project_path, args)
-    create_setup_py(project_path, args)
-    create_requirements_txt(project_path, args.deps)
-    create_sample_code(project_path, args.project_name)
-    create_readme_docs(project_path, args.project_name)
-    
-    if args.license != "None":
-        create_license(project_path, args.license, args.author)
-    
-    # Initialize git if requested
-    git_initialized = False
-    if not args.no_git:
-        git_initialized = initialize_git(project_path)
-    
-    # Create virtual environment if requested
-    venv_activate_cmd = None
-    if not args.no_venv:
-        venv_activate_cmd = create_virtual_environment(project_path, args.project_name)
+    create_directory_structure(project_path, args.project_name)
+    
+    # Run git init and venv creation in the background while files are written.
+    # The workers capture their subprocess output and return any error, so
+    # all status lines are printed here, in order, from the main thread.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        git_future = None
+        if not args.no_git:
+            git_future = executor.submit(initialize_git, project_path)
+        venv_future = None
+        if not args.no_venv:
+            venv_future = executor.submit(create_virtual_environment, project_path, args.project_name, args.deps)
+        
+        write_project_files(project_path, args)
+        
+        # Wait for git initialization if requested
+        git_initialized = False
+        if git_future is not None:
+            git_initialized, git_error = git_future.result()
+            if git_initialized:
+                print(f"✅ Initialized git repository")
+            else:
+                print("❌ Failed to initialize git repository:")
+                print(textwrap.indent(git_error, "   "))
+        
+        # Wait for the virtual environment
+        venv_activate_cmd = None
+        if venv_future is not None:
+            venv_activate_cmd, venv_error = venv_future.result()
+            if venv_activate_cmd:
+                print(f"✅ Created virtual environment")
+            else:
+                print("❌ Failed to create virtual environment:")
+                print(textwrap.indent(venv_error, "   "))
+    
+    # Install from the requirements.txt written above
+    if venv_activate_cmd:
+        install_dependencies(project_path, args.deps)
     
     # Print success message
     print("\n" + "=" * 80)
@@ -711,43 +928,7 @@ def main():
         try:
             print("\nOpening project in VSCode...")
             
-            # Create VSCode settings to use the virtual environment
-            vscode_dir = project_path / ".vscode"
-            os.makedirs(vscode_dir, exist_ok=True)
-            
-            # Create settings.json with Python path to the virtual environment
-            settings = {
-                "python.defaultInterpreterPath": "${workspaceFolder}/venv/bin/python",
-                "python.terminal.activateEnvironment": true,
-                "git.enableSmartCommit": true,
-                "editor.formatOnSave": true,
-                "python.formatting.provider": "black",
-                "python.linting.enabled": true,
-                "python.linting.flake8Enabled": true
-            }
-            
-            # Windows uses a different path
-            if os.name == 'nt':
-                settings["python.defaultInterpreterPath"] = "${workspaceFolder}\\venv\\Scripts\\python.exe"
-            
-            # Write settings.json
-            import json
-            with open(vscode_dir / "settings.json", "w") as f:
-                json.dump(settings, f, indent=4)
-                
-            # Create VSCode extensions recommendations
-            extensions = {
-                "recommendations": [
-                    "ms-python.python",
-                    "ms-python.vscode-pylance",
-                    "ms-toolsai.jupyter",
-                    "njpwerner.autodocstring",
-                    "streetsidesoftware.code-spell-checker"
-                ]
-            }
-            
-            with open(vscode_dir / "extensions.json", "w") as f:
-                json.dump(extensions, f, indent=4)
+            create_vscode_settings(project_path)
             
             # Open VSCode in the project directory
             subprocess.Popen(["code", str(project_path)], close_fds=True)
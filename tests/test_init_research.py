@@ -0,0 +1,75 @@
+"""
+Test cases for the pyresearch_init project generator.
+"""
+import hashlib
+import json
+import sys
+
+from pyresearch_init import init_research
+from pyresearch_init.init_research import (
+    _build_parser,
+    create_sample_code,
+    create_vscode_settings,
+    parse_arguments,
+    write_project_files,
+)
+
+# SHA-256 of every file the generator writes for the project in
+# test_write_project_files_golden_output, taken from the original generator
+GOLDEN_DIGESTS = {
+    ".gitignore": "7f9547154a718f985811ffd287a5a605001ab9d2ff652665095ded4c8334a194",
+    "LICENSE": "71a3c9d7004ec2cee9fa7e67058b2c2e0e78c82fc4a4531a912f3ff2ab95c2fe",
+    "README.md": "b960ab8fe6920331a159e2a4c65cf93e38e7440ef460f7b7eb9ad6d20a28f302",
+    "data/processed/.gitkeep": "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855",
+    "data/raw/.gitkeep": "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855",
+    "docs/README.md": "a0aab6eec2007bb2dd6b467a35495ef4fb6deb768c2cf3899fc8280c6464a4df",
+    "notebooks/sample_notebook.ipynb": "7dbe0c2168cf3b0daed8f85823f8508953aa43b648f8725667fc7b658b8f958a",
+    "pyproject.toml": "7f08dbde14adb880bac75a36600ab4754f0b20e303a0501e205f8b66b178830f",
+    "requirements.txt": "8401997c6ee1f708d74f3cd52d19cf8d53aab11f4c3df1423bd2ecf81ff73b34",
+    "results/figures/.gitkeep": "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855",
+    "results/models/.gitkeep": "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855",
+    "setup.py": "5d08e1f6d43844b4767807162ff1f888b20bf9b09e37279745d0a4755ba7e250",
+    "src/demo/core.py": "984d126aca4b236ad3bdc587361f2b7f5da208304c606ceb8e03588be77c474e",
+    "src/demo/utils.py": "7bd92e32fbe747867c58ddf0f7da3b7065fcb5f5105752c3b5526f2d8980a356",
+    "tests/test_core.py": "9a15a839d009cbed39cea04cefb141c5ef91867b65141c7ec778bbb8ff543c16",
+}
+
+
+def test_parse_arguments_fast_path_matches_argparse_defaults(monkeypatch):
+    """Test that the bare project-name fast path returns argparse's defaults."""
+    monkeypatch.setattr(sys, "argv", ["pyresearch-init", "demo"])
+    result = parse_arguments()
+    assert vars(result) == vars(_build_parser().parse_args(["demo"]))
+
+
+def test_sample_notebook_escapes_project_name(tmp_path):
+    """Test that quotes and backslashes in the project name keep the notebook valid JSON."""
+    files = dict(create_sample_code(tmp_path, 'we"ird\\x'))
+    notebook = json.loads(files[tmp_path / "notebooks" / "sample_notebook.ipynb"])
+    assert notebook["cells"][0]["source"][0] == '# we"ird\\x Research Notebook\n'
+
+
+def test_write_project_files_golden_output(tmp_path, monkeypatch):
+    """Test that the generated files are byte-identical to the golden output."""
+    monkeypatch.setattr(init_research, "_CURRENT_YEAR", 2026)
+    args = _build_parser().parse_args(
+        ["demo", "--no-git", "--no-venv", "-a", "Jane", "-e", "j@x.com", "-d", "desc"]
+    )
+    project_path = tmp_path / "demo"
+    write_project_files(project_path, args)
+    
+    digests = {
+        path.relative_to(project_path).as_posix(): hashlib.sha256(path.read_bytes()).hexdigest()
+        for path in project_path.rglob("*")
+        if path.is_file()
+    }
+    assert digests == GOLDEN_DIGESTS
+
+
+def test_create_vscode_settings_writes_valid_json(tmp_path):
+    """Test that the VSCode settings are written as JSON with real booleans."""
+    create_vscode_settings(tmp_path)
+    settings = json.loads((tmp_path / ".vscode" / "settings.json").read_text())
+    assert settings["python.terminal.activateEnvironment"] is True
+    extensions = json.loads((tmp_path / ".vscode" / "extensions.json").read_text())
+    assert "ms-python.python" in extensions["recommendations"]